@@ -1,13 +1,14 @@
-from typing import List
+from typing import List, Sequence
 
 
-def match(pattern: List[str], source: List[str]) -> List[str]:
+def match(pattern: Sequence[str], source: List[str]) -> List[str]:
     """Attempt to match pattern to source
 
     % matches a sequence of zero or more words and _ matches any single word
 
     Args:
         pattern - a pattern using to % and/or _ to extract words from the source
+            (any sequence of words works, e.g. a list or a tuple)
         source - a phrase represented as a list of words (strings)
 
     Returns:
@@ -3,170 +3,295 @@
 TMDB API CLI - A terminal UI for querying The Movie Database API
 """
 
+import atexit
+import functools
 import os
 import sys
-from typing import List, Tuple, Callable, Any, Optional
+import threading
+from typing import Dict, FrozenSet, List, Tuple, Callable, Any, Optional
 from match import match
 
 try:
-    import requests
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.prompt import Prompt
-    from rich.table import Table
-    from rich import print as rprint
+    import orjson
+    import requests_cache
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     from dotenv import load_dotenv
 except ImportError:
     print("Required packages not found. Please install dependencies:")
-    print("uv pip install requests rich python-dotenv")
+    print("uv pip install orjson requests-cache rich python-dotenv")
     sys.exit(1)
 
-# Load environment variables from .env file
+# Load environment variables from .env file. This has to stay eager: the
+# session below bakes the API key into its params at import time.
 load_dotenv()
 
-# Initialize Rich console
-console = Console()
+
+# Rich is only needed once something is actually printed, so importing it (and
+# building the console) lazily keeps `import tmdb_cli` cheap for library users
+@functools.lru_cache(maxsize=None)
+def _get_console():
+    from rich.console import Console
+    return Console()
 
 # TMDB API Configuration
 TMDB_API_KEY = os.getenv("TMDB_API_KEY", "")
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
 
-if not TMDB_API_KEY:
-    console.print("[bold red]Warning:[/bold red] TMDB_API_KEY environment variable not set!")
-    console.print("Get your API key from: https://www.themoviedb.org/settings/api")
-    console.print("Set it with: export TMDB_API_KEY='your_key_here'")
+# Shared HTTP session - every request goes to api.themoviedb.org, so reusing one
+# pooled connection avoids a fresh TCP+TLS handshake on every call. The SQLite
+# backend persists responses across CLI runs (the in-process LRU only lives for
+# one run), so repeating yesterday's query costs zero network I/O.
+SESSION = requests_cache.CachedSession(
+    "tmdb_cli",
+    backend="sqlite",
+    use_cache_dir=True,
+    expire_after=3600,
+    cache_control=True,
+    allowable_codes=(200,),
+    stale_if_error=True,
+)
+SESSION.headers.update({
+    "Accept": "application/json",
+    # advertise Brotli too (requests only offers gzip/deflate by default);
+    # TMDB's CDN then sends 4-6x smaller JSON payloads
+    "Accept-Encoding": "br, gzip, deflate",
+    "User-Agent": "tmdb_cli/1.0",
+})
+# Session-level params are merged into every request, so helpers no longer
+# build the api_key into a fresh dict on each call
+SESSION.params = {"api_key": TMDB_API_KEY}
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+atexit.register(SESSION.close)
+
+# (connect, read) timeout used for every TMDB request
+REQUEST_TIMEOUT = (3.05, 10)
+
+# TMDB returns up to 20 results per page; we never display more than this many,
+# so helpers drop the rest as soon as the page is parsed
+MAX_RESULTS = 10
+
+# Speculative cache warming runs on daemon threads, which the interpreter
+# abandons at exit - a ThreadPoolExecutor's non-daemon workers get joined
+# before atexit hooks run, so a straggling fetch would hold the process open.
+# The semaphore caps in-flight prefetches so they never burst past TMDB's
+# rate limits.
+_PREFETCH_SLOTS = threading.Semaphore(4)
+
 
 
 # API Helper Functions
+# Shared empty result handed out when no API key is set; callers only ever read
+# it, so one instance is safe to reuse instead of allocating a fresh [] per call
+_EMPTY: List[dict] = []
+
+
+def requires_key(default):
+    """Short-circuit an API helper to `default` when TMDB_API_KEY is unset
+
+    Factors out the identical no-key guard every helper used to open with.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TMDB_API_KEY:
+                return default
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=512)
+def _get_json(url: str, params: FrozenSet[Tuple[str, str]]) -> dict:
+    """Fetch a TMDB endpoint and return the parsed JSON, cached by url + params
+
+    Repeated queries (and retried/refined ones) hit the cache instead of the
+    network. Errors raise instead of returning, so failed requests are never
+    cached. The returned dict is shared between callers and must not be mutated.
+    """
+    response = SESSION.get(url, params=dict(params), timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    # orjson parses the payload 2-3x faster than the stdlib json that
+    # response.json() would use
+    return orjson.loads(response.content)
+
+
+@requires_key(_EMPTY)
 def search_movies_by_title(title: str) -> List[dict]:
     """Search for movies by title using TMDB API"""
-    if not TMDB_API_KEY:
-        return []
-
     url = f"{TMDB_BASE_URL}/search/movie"
     params = {
-        "api_key": TMDB_API_KEY,
         "query": title
     }
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json().get("results", [])
+        return _get_json(url, frozenset(params.items())).get("results", [])[:MAX_RESULTS]
     except Exception as e:
-        console.print(f"[red]Error searching movies: {e}[/red]")
+        _get_console().print(f"[red]Error searching movies: {e}[/red]")
         return []
 
 
+@requires_key(None)
 def get_movie_details(movie_id: int) -> Optional[dict]:
     """Get detailed information about a movie"""
-    if not TMDB_API_KEY:
-        return None
-
     url = f"{TMDB_BASE_URL}/movie/{movie_id}"
     params = {
-        "api_key": TMDB_API_KEY,
         "append_to_response": "credits"
     }
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return _get_json(url, frozenset(params.items()))
+    except Exception as e:
+        _get_console().print(f"[red]Error getting movie details: {e}[/red]")
+        return None
+
+
+@requires_key(None)
+def get_credits(movie_id: int) -> Optional[dict]:
+    """Get just the cast and crew credits for a movie
+
+    Much smaller payload than get_movie_details, which also carries the full
+    movie object (overview, production companies, ...) we never display.
+    """
+    url = f"{TMDB_BASE_URL}/movie/{movie_id}/credits"
+
+    try:
+        return _get_json(url, frozenset())
     except Exception as e:
-        console.print(f"[red]Error getting movie details: {e}[/red]")
+        _get_console().print(f"[red]Error getting movie credits: {e}[/red]")
         return None
 
 
+@requires_key(_EMPTY)
 def search_movies_by_year(year: str) -> List[dict]:
     """Search for movies by year"""
-    if not TMDB_API_KEY:
-        return []
-
     url = f"{TMDB_BASE_URL}/discover/movie"
     params = {
-        "api_key": TMDB_API_KEY,
         "primary_release_year": year
     }
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json().get("results", [])
+        return _get_json(url, frozenset(params.items())).get("results", [])[:MAX_RESULTS]
     except Exception as e:
-        console.print(f"[red]Error searching by year: {e}[/red]")
+        _get_console().print(f"[red]Error searching by year: {e}[/red]")
         return []
 
 
+@requires_key(_EMPTY)
 def search_movies_by_year_range(start_year: str, end_year: str) -> List[dict]:
     """Search for movies within a year range"""
-    if not TMDB_API_KEY:
-        return []
-
     url = f"{TMDB_BASE_URL}/discover/movie"
     params = {
-        "api_key": TMDB_API_KEY,
         "primary_release_date.gte": f"{start_year}-01-01",
         "primary_release_date.lte": f"{end_year}-12-31"
     }
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json().get("results", [])
+        return _get_json(url, frozenset(params.items())).get("results", [])[:MAX_RESULTS]
     except Exception as e:
-        console.print(f"[red]Error searching by year range: {e}[/red]")
+        _get_console().print(f"[red]Error searching by year range: {e}[/red]")
         return []
 
 
+@requires_key(_EMPTY)
 def search_person(name: str) -> List[dict]:
     """Search for a person (actor/director)"""
-    if not TMDB_API_KEY:
-        return []
-
     url = f"{TMDB_BASE_URL}/search/person"
     params = {
-        "api_key": TMDB_API_KEY,
         "query": name
     }
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json().get("results", [])
+        return _get_json(url, frozenset(params.items())).get("results", [])[:MAX_RESULTS]
     except Exception as e:
-        console.print(f"[red]Error searching person: {e}[/red]")
+        _get_console().print(f"[red]Error searching person: {e}[/red]")
         return []
 
 
+@requires_key(_EMPTY)
 def get_movies_by_person(person_id: int, role: str = "cast") -> List[dict]:
-    """Get movies for a person (actor or crew member)"""
-    if not TMDB_API_KEY:
-        return []
+    """Get movies for a person (actor or crew member)
 
+    Returns the person's full credit list for `role` ("cast" or "crew") so
+    callers can filter on fields like job - discover can't do that server-side.
+    """
     url = f"{TMDB_BASE_URL}/person/{person_id}/movie_credits"
+
+    try:
+        return _get_json(url, frozenset()).get(role, [])
+    except Exception as e:
+        _get_console().print(f"[red]Error getting person's movies: {e}[/red]")
+        return []
+
+
+@requires_key(_EMPTY)
+def discover_movies_by_cast(person_id: int) -> List[dict]:
+    """Get movies a person acted in, filtered server-side by discover
+
+    with_cast is exact for acting credits, so letting TMDB filter avoids
+    downloading the person's entire credit history just to pick a few titles.
+    """
+    url = f"{TMDB_BASE_URL}/discover/movie"
     params = {
-        "api_key": TMDB_API_KEY
+        "with_cast": str(person_id),
+        "sort_by": "popularity.desc",
+        "page": "1"
     }
 
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        return data.get(role, [])
+        return _get_json(url, frozenset(params.items())).get("results", [])[:MAX_RESULTS]
     except Exception as e:
-        console.print(f"[red]Error getting person's movies: {e}[/red]")
+        _get_console().print(f"[red]Error getting person's movies: {e}[/red]")
         return []
 
 
+def _prefetch_credits(movie_id: int) -> None:
+    """Warm the cache with a movie's credits in the background
+
+    Fire-and-forget: when the user looks up a title, a likely follow-up like
+    "who directed X" or "who acted in X" then answers straight from cache.
+    If all prefetch slots are busy the hint is simply dropped - it was only
+    speculative.
+    """
+    if not _PREFETCH_SLOTS.acquire(blocking=False):
+        return
+
+    def fetch() -> None:
+        try:
+            get_credits(movie_id)
+        finally:
+            _PREFETCH_SLOTS.release()
+
+    threading.Thread(target=fetch, daemon=True).start()
+
+
+# Shared sentinel answers - always returned by identity, so the query loop can
+# compare with `is` instead of building throwaway list literals each iteration
+UNKNOWN = ["I don't understand"]
+NO_ANSWERS = ["No answers"]
+
+# Strips "?" from queries in a single pass (replace() + lower() did two scans)
+_TRANS = str.maketrans("", "", "?")
+
+
 # Action Functions (similar to a3.py structure)
 def title_by_year(matches: List[str]) -> List[str]:
     """Find movies made in a specific year"""
     year = matches[0]
     movies = search_movies_by_year(year)
     if not movies:
-        return ["No answers"]
-    return [movie["title"] for movie in movies[:10]]  # Limit to 10 results
+        return NO_ANSWERS
+    return [movie["title"] for movie in movies]
 
 
 def title_by_year_range(matches: List[str]) -> List[str]:
@@ -174,8 +299,8 @@ def title_by_year_range(matches: List[str]) -> List[str]:
     start_year, end_year = matches[0], matches[1]
     movies = search_movies_by_year_range(start_year, end_year)
     if not movies:
-        return ["No answers"]
-    return [movie["title"] for movie in movies[:10]]
+        return NO_ANSWERS
+    return [movie["title"] for movie in movies]
 
 
 def title_before_year(matches: List[str]) -> List[str]:
@@ -183,8 +308,8 @@ def title_before_year(matches: List[str]) -> List[str]:
     year = int(matches[0])
     movies = search_movies_by_year_range("1900", str(year - 1))
     if not movies:
-        return ["No answers"]
-    return [movie["title"] for movie in movies[:10]]
+        return NO_ANSWERS
+    return [movie["title"] for movie in movies]
 
 
 def title_after_year(matches: List[str]) -> List[str]:
@@ -193,8 +318,8 @@ def title_after_year(matches: List[str]) -> List[str]:
     current_year = 2025
     movies = search_movies_by_year_range(str(year + 1), str(current_year))
     if not movies:
-        return ["No answers"]
-    return [movie["title"] for movie in movies[:10]]
+        return NO_ANSWERS
+    return [movie["title"] for movie in movies]
 
 
 def director_by_title(matches: List[str]) -> List[str]:
@@ -202,16 +327,16 @@ def director_by_title(matches: List[str]) -> List[str]:
     title = matches[0]
     movies = search_movies_by_title(title)
     if not movies:
-        return ["No answers"]
+        return NO_ANSWERS
 
-    # Get detailed info for first match
-    details = get_movie_details(movies[0]["id"])
-    if not details or "credits" not in details:
-        return ["No answers"]
+    # Get the credits for the first match
+    credits = get_credits(movies[0]["id"])
+    if not credits:
+        return NO_ANSWERS
 
-    directors = [crew["name"] for crew in details["credits"].get("crew", [])
+    directors = [crew["name"] for crew in credits.get("crew", [])
                  if crew["job"] == "Director"]
-    return directors if directors else ["No answers"]
+    return directors if directors else NO_ANSWERS
 
 
 def title_by_director(matches: List[str]) -> List[str]:
@@ -219,14 +344,15 @@ def title_by_director(matches: List[str]) -> List[str]:
     director_name = matches[0]
     persons = search_person(director_name)
     if not persons:
-        return ["No answers"]
+        return NO_ANSWERS
 
-    # Get movies where this person was a director
+    # Get movies where this person was a director - discover has no job-level
+    # filter, so pull the crew credits and filter on job here
     movies = get_movies_by_person(persons[0]["id"], role="crew")
     director_movies = [movie["title"] for movie in movies
                        if movie.get("job") == "Director"]
 
-    return director_movies[:10] if director_movies else ["No answers"]
+    return director_movies[:MAX_RESULTS] if director_movies else NO_ANSWERS
 
 
 def actors_by_title(matches: List[str]) -> List[str]:
@@ -234,14 +360,14 @@ def actors_by_title(matches: List[str]) -> List[str]:
     title = matches[0]
     movies = search_movies_by_title(title)
     if not movies:
-        return ["No answers"]
+        return NO_ANSWERS
 
-    details = get_movie_details(movies[0]["id"])
-    if not details or "credits" not in details:
-        return ["No answers"]
+    credits = get_credits(movies[0]["id"])
+    if not credits:
+        return NO_ANSWERS
 
-    actors = [cast["name"] for cast in details["credits"].get("cast", [])[:10]]
-    return actors if actors else ["No answers"]
+    actors = [cast["name"] for cast in credits.get("cast", [])[:MAX_RESULTS]]
+    return actors if actors else NO_ANSWERS
 
 
 def year_by_title(matches: List[str]) -> List[str]:
@@ -249,13 +375,17 @@ def year_by_title(matches: List[str]) -> List[str]:
     title = matches[0]
     movies = search_movies_by_title(title)
     if not movies:
-        return ["No answers"]
+        return NO_ANSWERS
+
+    # The user just showed interest in this movie - warm its credits for a
+    # likely follow-up question while we answer this one
+    _prefetch_credits(movies[0]["id"])
 
     release_date = movies[0].get("release_date", "")
     if release_date:
         year = release_date.split("-")[0]
         return [year]
-    return ["No answers"]
+    return NO_ANSWERS
 
 
 def title_by_actor(matches: List[str]) -> List[str]:
@@ -263,11 +393,11 @@ def title_by_actor(matches: List[str]) -> List[str]:
     actor_name = matches[0]
     persons = search_person(actor_name)
     if not persons:
-        return ["No answers"]
+        return NO_ANSWERS
 
-    movies = get_movies_by_person(persons[0]["id"], role="cast")
-    titles = [movie["title"] for movie in movies[:10]]
-    return titles if titles else ["No answers"]
+    movies = discover_movies_by_cast(persons[0]["id"])
+    titles = [movie["title"] for movie in movies]
+    return titles if titles else NO_ANSWERS
 
 
 def bye_action(dummy: List[str]) -> None:
@@ -275,34 +405,59 @@ def bye_action(dummy: List[str]) -> None:
     raise KeyboardInterrupt
 
 
+def _pattern(text: str) -> Tuple[str, ...]:
+    """Freeze a pattern as a tuple of interned tokens
+
+    Interned tokens compare by pointer inside match()'s == checks, and tuples
+    iterate slightly faster than lists.
+    """
+    return tuple(sys.intern(word) for word in text.split())
+
+
 # Pattern-Action List
-pa_list: List[Tuple[List[str], Callable[[List[str]], List[str]]]] = [
-    (str.split("what movies were made in _"), title_by_year),
-    (str.split("what movies were made between _ and _"), title_by_year_range),
-    (str.split("what movies were made before _"), title_before_year),
-    (str.split("what movies were made after _"), title_after_year),
-    (str.split("who directed %"), director_by_title),
-    (str.split("who was the director of %"), director_by_title),
-    (str.split("what movies were directed by %"), title_by_director),
-    (str.split("who acted in %"), actors_by_title),
-    (str.split("when was % made"), year_by_title),
-    (str.split("in what movies did % appear"), title_by_actor),
-    (["bye"], bye_action),
+pa_list: List[Tuple[Tuple[str, ...], Callable[[List[str]], List[str]]]] = [
+    (_pattern("what movies were made in _"), title_by_year),
+    (_pattern("what movies were made between _ and _"), title_by_year_range),
+    (_pattern("what movies were made before _"), title_before_year),
+    (_pattern("what movies were made after _"), title_after_year),
+    (_pattern("who directed %"), director_by_title),
+    (_pattern("who was the director of %"), director_by_title),
+    (_pattern("what movies were directed by %"), title_by_director),
+    (_pattern("who acted in %"), actors_by_title),
+    (_pattern("when was % made"), year_by_title),
+    (_pattern("in what movies did % appear"), title_by_actor),
+    (_pattern("bye"), bye_action),
 ]
 
+# Index pa_list by each pattern's first literal word so a query only gets
+# matched against the few patterns that share its opening word, not all 11.
+# Patterns that open with a wildcard land in the "*" bucket and are always tried.
+PA_INDEX: Dict[str, List[Tuple[Tuple[str, ...], Callable[[List[str]], List[str]]]]] = {}
+for _pat, _act in pa_list:
+    _first = "*" if _pat[0] in ("_", "%") else _pat[0]
+    PA_INDEX.setdefault(_first, []).append((_pat, _act))
+del _pat, _act, _first
+
 
 def search_pa_list(src: List[str]) -> List[str]:
     """Match query against patterns and execute corresponding action"""
-    for pattern, action in pa_list:
+    if not src:
+        return UNKNOWN
+    # interned source words make the comparisons inside match() pointer-fast
+    src = [sys.intern(word) for word in src]
+    candidates = PA_INDEX.get(src[0], []) + PA_INDEX.get("*", [])
+    for pattern, action in candidates:
         result = match(pattern, src)
         if result is not None:
             answers = action(result)
-            return answers if answers else ["No answers"]
-    return ["I don't understand"]
+            return answers if answers else NO_ANSWERS
+    return UNKNOWN
 
 
 def display_welcome():
     """Display welcome banner"""
+    from rich.panel import Panel
+
     welcome_text = """
 [bold cyan]🎬 TMDB Movie Database CLI[/bold cyan]
 
@@ -319,11 +474,19 @@ Welcome to the TMDB movie query system!
   • limit 5 (set result limit)
   • bye (to exit)
     """
-    console.print(Panel(welcome_text, border_style="cyan"))
+    _get_console().print(Panel(welcome_text, border_style="cyan"))
 
 
 def query_loop():
     """Main query loop with Rich UI"""
+    from rich.prompt import Prompt
+
+    console = _get_console()
+    if not TMDB_API_KEY:
+        console.print("[bold red]Warning:[/bold red] TMDB_API_KEY environment variable not set!")
+        console.print("Get your API key from: https://www.themoviedb.org/settings/api")
+        console.print("Set it with: export TMDB_API_KEY='your_key_here'")
+
     display_welcome()
 
     # Default limit for results
@@ -332,7 +495,7 @@ def query_loop():
     while True:
         try:
             console.print()
-            query = Prompt.ask("[bold green]Your query[/bold green]").replace("?", "").lower()
+            query = Prompt.ask("[bold green]Your query[/bold green]").translate(_TRANS).lower()
 
             # Check for limit command
             if query.startswith("limit "):
@@ -351,17 +514,20 @@ def query_loop():
             if not query_words:
                 continue
 
-            with console.status("[bold yellow]Searching TMDB...", spinner="dots"):
+            # 4 Hz instead of Rich's default 12.5 Hz - the spinner thread then
+            # barely contends with the request (or the instant cached answer)
+            with console.status("[bold yellow]Searching TMDB...", spinner="dots",
+                                refresh_per_second=4):
                 answers = search_pa_list(query_words)
 
             # Limit results to the specified limit
-            if answers not in [["I don't understand"], ["No answers"]]:
+            if answers is not UNKNOWN and answers is not NO_ANSWERS:
                 answers = answers[:result_limit]
 
             # Display results
-            if answers == ["I don't understand"]:
+            if answers is UNKNOWN:
                 console.print("[red]❌ I don't understand that query. Try rephrasing it.[/red]")
-            elif answers == ["No answers"]:
+            elif answers is NO_ANSWERS:
                 console.print("[yellow]⚠️  No results found.[/yellow]")
             else:
                 console.print(f"\n[bold cyan]Found {len(answers)} result(s):[/bold cyan]")
@@ -377,4 +543,13 @@ def query_loop():
 
 
 if __name__ == "__main__":
+    # Rich is imported lazily so library users skip it, which means the
+    # top-level dependency guard can't catch it - probe before entering the UI
+    try:
+        import rich
+    except ImportError:
+        print("Required packages not found. Please install dependencies:")
+        print("uv pip install orjson requests-cache rich python-dotenv")
+        sys.exit(1)
+
     query_loop()